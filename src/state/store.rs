@@ -2,7 +2,7 @@
 
 use anyhow::{Context, Result};
 use std::fs;
-use std::io;
+use std::io::{self, Write};
 use std::path::{Path, PathBuf};
 use tracing::{info, trace, warn};
 
@@ -69,11 +69,12 @@ impl StateStore {
 
     /// Create or update agent state.
     ///
-    /// Uses atomic write (temp file + rename) for crash safety.
+    /// Uses atomic write (temp file + rename) for crash safety. Written as
+    /// compact JSON since these files are re-read on every reconciliation.
     pub fn upsert_agent(&self, state: &AgentState) -> Result<()> {
         let path = self.agent_path(&state.pane_key);
-        let content = serde_json::to_string_pretty(state)?;
-        write_atomic(&path, content.as_bytes())
+        let content = serde_json::to_vec(state)?;
+        write_atomic(&path, &content)
     }
 
     /// Read agent state by pane key.
@@ -99,9 +100,6 @@ impl StateStore {
             let entry = entry?;
             let path = entry.path();
             if path.extension().is_some_and(|e| e == "json")
-                && !path
-                    .file_name()
-                    .is_some_and(|n| n.to_string_lossy().ends_with(".tmp"))
                 && let Some(state) = read_agent_file(&path)?
             {
                 agents.push(state);
@@ -287,8 +285,8 @@ impl StateStore {
                 .session_name
                 .map(|n| remap_full_name(&n, old_full_base, new_full_base));
 
-            let content = serde_json::to_string_pretty(&state)?;
-            write_atomic(&path, content.as_bytes())?;
+            let content = serde_json::to_vec(&state)?;
+            write_atomic(&path, &content)?;
             migrated += 1;
         }
 
@@ -464,11 +462,16 @@ impl StateStore {
 
 /// Write content atomically using temp file + rename.
 ///
-/// This ensures the target file is never partially written.
+/// This ensures the target file is never partially written. The temp file
+/// gets a unique random name, so concurrent writers (across processes or
+/// threads) never clobber each other's temp file before the rename, and it
+/// is removed if the write or the rename fails.
 fn write_atomic(path: &Path, content: &[u8]) -> Result<()> {
-    let tmp = path.with_extension("json.tmp");
-    fs::write(&tmp, content).context("Failed to write temp file")?;
-    fs::rename(&tmp, path).context("Failed to rename temp file")?;
+    let dir = path.parent().unwrap_or_else(|| Path::new("."));
+    let mut tmp = tempfile::NamedTempFile::new_in(dir).context("Failed to create temp file")?;
+    tmp.write_all(content)
+        .context("Failed to write temp file")?;
+    tmp.persist(path).context("Failed to rename temp file")?;
     Ok(())
 }
 
@@ -503,8 +506,8 @@ fn remap_full_name(name: &str, old_base: &str, new_base: &str) -> String {
 /// Returns None if file doesn't exist.
 /// Deletes corrupted files and returns None (recoverable error).
 fn read_agent_file(path: &Path) -> Result<Option<AgentState>> {
-    match fs::read_to_string(path) {
-        Ok(content) => match serde_json::from_str(&content) {
+    match fs::read(path) {
+        Ok(content) => match serde_json::from_slice(&content) {
             Ok(state) => Ok(Some(state)),
             Err(e) => {
                 warn!(?path, error = %e, "corrupted state file, deleting");
@@ -634,7 +637,7 @@ mod tests {
         for entry in fs::read_dir(&agents_dir).unwrap() {
             let entry = entry.unwrap();
             let name = entry.file_name().to_string_lossy().to_string();
-            assert!(!name.ends_with(".tmp"), "temp file should be cleaned up");
+            assert!(!name.contains(".tmp"), "temp file should be cleaned up");
         }
     }
 
@@ -709,9 +712,10 @@ mod tests {
 
         store.upsert_agent(&state).unwrap();
 
-        // Create a stray tmp file
-        let tmp_path = dir.path().join("agents").join("some_file.json.tmp");
-        fs::write(&tmp_path, "{}").unwrap();
+        // Create stray tmp files (legacy name and a write_atomic leftover)
+        let agents_dir = dir.path().join("agents");
+        fs::write(agents_dir.join("some_file.json.tmp"), "{}").unwrap();
+        fs::write(agents_dir.join(".tmpAbC123"), "{}").unwrap();
 
         let agents = store.list_all_agents().unwrap();
         assert_eq!(agents.len(), 1);
@@ -1,3 +1,4 @@
+import fnmatch
 import json
 import os
 import re
@@ -7,6 +8,8 @@ import subprocess
 import tempfile
 import time
 import unicodedata
+import uuid
+import warnings
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, Callable, Dict, Generator, List, Optional, Union
@@ -24,6 +27,9 @@ import yaml
 # Shell names to test - paths are discovered dynamically via shutil.which()
 SHELL_NAMES = ["bash", "zsh", "fish", "nu"]
 
+# Shell used for shell-parametrized tests unless TEST_ALL_SHELLS=1
+DEFAULT_SHELL_NAME = "zsh"
+
 
 @dataclass
 class ShellCommands:
@@ -114,8 +120,10 @@ def get_shells_to_test() -> list[str]:
 
     Environment variables:
         TEST_SHELL: Test a specific shell only (e.g., "fish", "nu", "bash", "zsh")
+        TEST_ALL_SHELLS: If set to 1, test all installed shells (bash, zsh, fish, nu)
 
-    By default, tests run against all installed shells (bash, zsh, fish, nu).
+    By default, tests run with zsh only (or the first installed shell if zsh
+    is missing), so shell-parametrized tests don't multiply by every shell.
     Uses shutil.which() to discover actual shell paths rather than hardcoding,
     ensuring portability across different systems (Linux, macOS, Homebrew, etc.).
     """
@@ -126,9 +134,14 @@ def get_shells_to_test() -> list[str]:
             return [path]
         raise ValueError(f"Shell '{specific_shell}' not found")
 
-    # Default: test all installed shells
     shells = [p for p in (shutil.which(name) for name in SHELL_NAMES) if p]
-    return shells if shells else ["/bin/sh"]
+    if not shells:
+        return ["/bin/sh"]
+    if os.environ.get("TEST_ALL_SHELLS") == "1":
+        return shells
+
+    # Default: zsh only, falling back to the first installed shell
+    return [shutil.which(DEFAULT_SHELL_NAME) or shells[0]]
 
 
 # =============================================================================
@@ -163,6 +176,8 @@ class MuxEnvironment(ABC):
     def __init__(self, tmp_path: Path):
         self.tmp_path = tmp_path
         self._scripts_dir: Optional[Path] = None  # Lazily created by get_scripts_dir()
+        # Scripts written by make_env_script, keyed by (command, env vars)
+        self._env_scripts: dict[tuple[str, tuple[tuple[str, str], ...]], str] = {}
 
         # Create isolated home directory
         self.home_path = self.tmp_path / "test_home"
@@ -336,15 +351,21 @@ class TmuxEnvironment(MuxEnvironment):
         # Ensure we don't accidentally target user's tmux or WezTerm
         self.env.pop("TMUX", None)
         self.env.pop("WEZTERM_PANE", None)
-        self.env["TMUX_CONF"] = "/dev/null"
 
     @property
     def backend_name(self) -> str:
         return "tmux"
 
     def start_server(self) -> None:
-        """Start isolated tmux server with a 'test' session."""
-        self.mux_command(["new-session", "-d", "-s", "test"])
+        """Start isolated tmux server with a 'test' session.
+
+        `-f /dev/null` keeps the server from loading /etc/tmux.conf or the
+        user's config; tmux only reads the config file when the server starts.
+        """
+        self.run_command(
+            ["tmux", "-S", str(self.socket_path), "-f", "/dev/null"]
+            + ["new-session", "-d", "-s", "test"]
+        )
 
     def stop_server(self) -> None:
         """Kill the tmux server and clean up socket."""
@@ -438,8 +459,6 @@ class WezTermEnvironment(MuxEnvironment):
     def __init__(self, tmp_path: Path):
         super().__init__(tmp_path)
 
-        import uuid
-
         self.workspace_name = f"workmux_test_{uuid.uuid4().hex[:8]}"
         self._created_pane_ids: list[str] = []
 
@@ -688,9 +707,18 @@ MuxEnv = Union[TmuxEnvironment, WezTermEnvironment]
 # =============================================================================
 
 
-def assert_window_exists(env: MuxEnvironment, window_name: str) -> None:
-    """Ensure a window/tab with the provided name exists."""
-    existing_windows = env.list_windows()
+def assert_window_exists(
+    env: MuxEnvironment,
+    window_name: str,
+    existing_windows: list[str] | None = None,
+) -> None:
+    """Ensure a window/tab with the provided name exists.
+
+    Pass `existing_windows` (from env.list_windows()) to check several names
+    against one snapshot instead of querying the multiplexer per name.
+    """
+    if existing_windows is None:
+        existing_windows = env.list_windows()
     assert window_name in existing_windows, (
         f"Window {window_name!r} not found. Existing: {existing_windows!r}"
     )
@@ -771,6 +799,23 @@ def wait_for_window_ready(
         assert False, f"Window {window_name!r} not ready within {timeout}s"
 
 
+def wait_for_shell_ready(
+    env: MuxEnvironment, window_name: str, timeout: float = 5.0
+) -> None:
+    """Wait until the shell in a window has executed a sentinel command.
+
+    First waits for the window to exist and draw something (send_keys fails
+    on a missing target). Non-empty pane content only means something was
+    drawn; the sentinel confirms the shell is actually reading input. The
+    typed command contains `""` so the sentinel only matches once the shell
+    has run it, not when keys are echoed.
+    """
+    wait_for_window_ready(env, window_name)
+    token = uuid.uuid4().hex[:8]
+    env.send_keys(window_name, f'echo __READY_""{token}__')
+    wait_for_pane_output(env, window_name, f"__READY_{token}__", timeout=timeout)
+
+
 def wait_for_pane_output(
     env: MuxEnvironment, window_name: str, text: str, timeout: float = 2.0
 ) -> None:
@@ -849,6 +894,33 @@ def wait_for_file(
     )
 
 
+def wait_for_glob(directory: Path, pattern: str, timeout: float = 5.0) -> Path:
+    """Poll until exactly one entry in `directory` matches `pattern`; return it.
+
+    Uses a single scandir pass per poll. A missing directory counts as no match.
+    """
+    matches: list[Path] = []
+
+    def _single_match() -> bool:
+        try:
+            with os.scandir(directory) as it:
+                matches[:] = [
+                    Path(entry.path)
+                    for entry in it
+                    if fnmatch.fnmatch(entry.name, pattern)
+                ]
+        except FileNotFoundError:
+            matches.clear()
+        return len(matches) == 1
+
+    if not poll_until(_single_match, timeout=timeout):
+        assert False, (
+            f"Expected one file matching {pattern!r} in {directory} within "
+            f"{timeout}s, found: {[p.name for p in matches]}"
+        )
+    return matches[0]
+
+
 # =============================================================================
 # Path & Naming Helpers
 # =============================================================================
@@ -988,6 +1060,10 @@ class FakeAgentInstaller:
         script_path.chmod(0o755)
         return script_path
 
+    def install_many(self, scripts: Dict[str, str]) -> Dict[str, Path]:
+        """Installs several fake agents at once; returns name -> script path."""
+        return {name: self.install(name, body) for name, body in scripts.items()}
+
 
 @pytest.fixture
 def fake_agent_installer(mux_server: MuxEnvironment) -> FakeAgentInstaller:
@@ -1031,12 +1107,64 @@ def pytest_addoption(parser):
     )
 
 
+# tmpfs used for test temp dirs when available (see use_ram_temproot)
+RAM_TEMPROOT = Path("/dev/shm")
+RAM_TEMPROOT_MIN_FREE = 1 << 30  # 1 GiB
+
+
+def use_ram_temproot(config) -> None:
+    """Point --basetemp at a per-user tmpfs (/dev/shm) directory when available.
+
+    Worktrees, prompt files and agent output are all disposable, so keeping
+    them in RAM avoids disk I/O. Like any --basetemp, the directory is wiped
+    at the start of each run, so concurrent runs by the same user need
+    WORKMUX_TEST_TMPFS=0 or their own --basetemp. Skipped when --basetemp or
+    PYTEST_DEBUG_TEMPROOT is set explicitly, in xdist workers (they inherit
+    a basetemp from the controller), when /dev/shm is missing or short on
+    space (e.g. macOS, small containers), when it is mounted noexec (fake
+    agents, hooks and editor scripts under tmp_path must be executable), or
+    when WORKMUX_TEST_TMPFS=0.
+    """
+    if (
+        config.option.basetemp
+        or hasattr(config, "workerinput")
+        or "PYTEST_DEBUG_TEMPROOT" in os.environ
+        or os.environ.get("WORKMUX_TEST_TMPFS") == "0"
+    ):
+        return
+    try:
+        stat = os.statvfs(RAM_TEMPROOT)
+    except OSError:
+        return
+    if not os.access(RAM_TEMPROOT, os.W_OK):
+        return
+    if stat.f_flag & os.ST_NOEXEC:
+        return
+    if stat.f_bavail * stat.f_frsize < RAM_TEMPROOT_MIN_FREE:
+        return
+    config.option.basetemp = str(RAM_TEMPROOT / f"workmux-tests-{os.getuid()}")
+
+
 def pytest_configure(config):
-    """Register custom markers."""
+    """Register custom markers and pick the temp root."""
     config.addinivalue_line(
         "markers",
         "tmux_only: mark test as tmux-specific (skipped for other backends)",
     )
+    # Without the plugin, pytest.mark.timeout is ignored, so hung agent
+    # startups are not capped. Keep the marker known and say so once.
+    if not config.pluginmanager.hasplugin("timeout"):
+        config.addinivalue_line(
+            "markers",
+            "timeout(seconds): per-test time limit (needs pytest-timeout)",
+        )
+        warnings.warn(
+            pytest.PytestConfigWarning(
+                "pytest-timeout is not installed; timeout markers are ignored. "
+                "Run: pip install -r tests/requirements.txt"
+            )
+        )
+    use_ram_temproot(config)
 
 
 def pytest_xdist_auto_num_workers(config) -> int | None:
@@ -1110,12 +1238,19 @@ def mux_server(request, tmp_path: Path) -> Generator[MuxEnvironment, None, None]
     else:
         test_env = WezTermEnvironment(tmp_path)
 
-    test_env.start_server()
-    yield test_env
-    test_env.stop_server()
-    # Clean up scripts directory if it was created
-    if test_env._scripts_dir is not None and test_env._scripts_dir.exists():
-        shutil.rmtree(test_env._scripts_dir, ignore_errors=True)
+    # pytest already resumes after the yield when a test fails; the try/finally
+    # additionally runs teardown if start_server fails, and still removes the
+    # scripts directory if stop_server raises.
+    try:
+        test_env.start_server()
+        yield test_env
+    finally:
+        try:
+            test_env.stop_server()
+        finally:
+            # Clean up scripts directory if it was created
+            if test_env._scripts_dir is not None and test_env._scripts_dir.exists():
+                shutil.rmtree(test_env._scripts_dir, ignore_errors=True)
 
 
 @pytest.fixture(params=get_shells_to_test(), ids=lambda s: Path(s).name)
@@ -1179,6 +1314,21 @@ def setup_git_repo(path: Path, env_vars: Optional[dict] = None):
     )
 
 
+def _link_immutable_git_file(src: str, dst: str) -> None:
+    """copytree copy_function that hardlinks files git never rewrites in place.
+
+    Loose objects and sample hooks are write-once, so sharing them with the
+    template is safe; everything else (index, refs, config) is copied.
+    """
+    if f"{os.sep}objects{os.sep}" in src or src.endswith(".sample"):
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
+
+
 @pytest.fixture(scope="session")
 def _template_git_repo(tmp_path_factory) -> Path:
     """Create a pristine git repository once per test session.
@@ -1197,13 +1347,18 @@ def repo_path(mux_server: MuxEnvironment, _template_git_repo: Path) -> Path:
 
     Copies from a session-scoped template repo instead of running git init
     per test. The git config (user.name, user.email) is stored in .git/config
-    and survives the copy.
+    and survives the copy. Immutable object files are hardlinked rather than
+    copied.
 
     This fixture is backend-agnostic and will run tests against all
     configured backends (tmux by default, or --backend=wezterm).
     """
     path = mux_server.tmp_path
-    shutil.copytree(_template_git_repo / ".git", path / ".git")
+    shutil.copytree(
+        _template_git_repo / ".git",
+        path / ".git",
+        copy_function=_link_immutable_git_file,
+    )
     shutil.copy(_template_git_repo / ".gitignore", path / ".gitignore")
     return path
 
@@ -1215,19 +1370,35 @@ def mux_repo_path(repo_path: Path) -> Path:
     return repo_path
 
 
+@pytest.fixture(scope="session")
+def _template_bare_repo(tmp_path_factory) -> Path:
+    """Create an empty bare git repository once per test session."""
+    path = tmp_path_factory.mktemp("template_bare_repo")
+    subprocess.run(
+        ["git", "init", "--bare"],
+        cwd=path,
+        check=True,
+        capture_output=True,
+    )
+    return path
+
+
 @pytest.fixture
-def remote_repo_path(mux_server: MuxEnvironment) -> Path:
+def remote_repo_path(mux_server: MuxEnvironment, _template_bare_repo: Path) -> Path:
     """Creates a bare git repo to act as a remote.
 
+    Copies from a session-scoped empty bare repo instead of running
+    git init --bare per test.
+
     This fixture is backend-agnostic.
     """
     parent = mux_server.tmp_path.parent
     remote_path = Path(tempfile.mkdtemp(prefix="remote_repo_", dir=parent))
-    subprocess.run(
-        ["git", "init", "--bare"],
-        cwd=remote_path,
-        check=True,
-        capture_output=True,
+    shutil.copytree(
+        _template_bare_repo,
+        remote_path,
+        copy_function=_link_immutable_git_file,
+        dirs_exist_ok=True,
     )
     return remote_path
 
@@ -1249,7 +1420,8 @@ def poll_until(
 
     Uses adaptive backoff: checks immediately, then ramps up the interval.
     The poll_interval parameter is kept for API compatibility but the adaptive
-    schedule is always used.
+    schedule is always used. Sleeps never overshoot the deadline, and the
+    condition is checked one final time when the deadline is reached.
 
     Args:
         condition: A callable that returns True when the condition is met
@@ -1262,12 +1434,12 @@ def poll_until(
     end = time.monotonic() + timeout
     intervals = [0.0, 0.01, 0.02, 0.05, 0.1]
     i = 0
-    while time.monotonic() < end:
+    while (remaining := end - time.monotonic()) > 0:
         if condition():
             return True
-        time.sleep(intervals[min(i, len(intervals) - 1)])
+        time.sleep(min(intervals[min(i, len(intervals) - 1)], remaining))
         i += 1
-    return False
+    return condition()
 
 
 def poll_until_file_has_content(file_path: Path, timeout: float = 5.0) -> bool:
@@ -1317,6 +1489,34 @@ def workmux_exe_path() -> Path:
     return local_path
 
 
+# Serialized YAML by repr() of the config dict. Many tests write the same
+# small config (e.g. a single "<agent>" pane), so dump each shape only once.
+_config_yaml_cache: Dict[str, str] = {}
+
+
+def _config_to_yaml(config: Dict[str, Any]) -> str:
+    """Serialize a workmux config to YAML, reusing earlier identical dumps."""
+    key = repr(config)
+    cached = _config_yaml_cache.get(key)
+    if cached is None:
+        cached = _config_yaml_cache[key] = yaml.dump(config)
+    return cached
+
+
+def _write_text_if_changed(path: Path, content: str) -> None:
+    """Write content to path unless the file already holds exactly that text.
+
+    Avoids bumping the mtime on no-op rewrites, which would otherwise look
+    like a config change to anything watching the file.
+    """
+    try:
+        if path.read_text() == content:
+            return
+    except FileNotFoundError:
+        pass
+    path.write_text(content)
+
+
 def write_workmux_config(
     repo_path: Path,
     panes: Optional[List[Dict[str, Any]]] = None,
@@ -1364,7 +1564,7 @@ def write_workmux_config(
         config["base_branch"] = base_branch
     if prompt_file_only is not None:
         config["prompt_file_only"] = prompt_file_only
-    (repo_path / ".workmux.yaml").write_text(yaml.dump(config))
+    _write_text_if_changed(repo_path / ".workmux.yaml", _config_to_yaml(config))
 
     # If env is provided, commit the config file to avoid uncommitted changes in merge tests
     if env:
@@ -1406,7 +1606,7 @@ def write_global_workmux_config(
     config_dir = env.home_path / ".config" / "workmux"
     config_dir.mkdir(parents=True, exist_ok=True)
     config_path = config_dir / "config.yaml"
-    config_path.write_text(yaml.dump(config))
+    _write_text_if_changed(config_path, _config_to_yaml(config))
     return config_path
 
 
@@ -1456,6 +1656,8 @@ def make_env_script(env: MuxEnvironment, command: str, env_vars: dict[str, str])
     """Create a script file that sets environment variables and runs a command.
 
     This avoids tmux send-keys line length limits when env vars or paths are long.
+    Identical (command, env_vars) pairs reuse the script already written for
+    this environment instead of writing a new file.
 
     Args:
         env: The multiplexer environment (provides tmp_path)
@@ -1465,6 +1667,10 @@ def make_env_script(env: MuxEnvironment, command: str, env_vars: dict[str, str])
     Returns:
         Path to the script file (as string) that can be passed to send_keys
     """
+    cache_key = (command, tuple(sorted(env_vars.items())))
+    if cached := env._env_scripts.get(cache_key):
+        return cached
+
     global _script_counter
     _script_counter += 1
     script_file = get_scripts_dir(env) / f"env_cmd_{_script_counter}.sh"
@@ -1476,6 +1682,7 @@ def make_env_script(env: MuxEnvironment, command: str, env_vars: dict[str, str])
 """
     script_file.write_text(script_content)
     script_file.chmod(0o755)
+    env._env_scripts[cache_key] = str(script_file)
     return str(script_file)
 
 
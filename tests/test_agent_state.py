@@ -13,16 +13,17 @@ verify the state files have the fields needed for reconciliation to work.
 """
 
 import json
+import os
+from collections.abc import Iterator
 from pathlib import Path
 
-
 from .conftest import (
     MuxEnvironment,
     get_window_name,
     make_env_script,
     poll_until,
     run_workmux_add,
-    wait_for_window_ready,
+    wait_for_shell_ready,
     write_workmux_config,
 )
 
@@ -37,17 +38,32 @@ def get_agents_dir(env: MuxEnvironment) -> Path:
     return get_state_dir(env) / "agents"
 
 
+def _iter_agent_state_entries(env: MuxEnvironment) -> Iterator[os.DirEntry[str]]:
+    """Yield directory entries for agent state files, if the directory exists."""
+    try:
+        with os.scandir(get_agents_dir(env)) as it:
+            for entry in it:
+                if entry.name.endswith(".json") and entry.is_file(
+                    follow_symlinks=False
+                ):
+                    yield entry
+    except FileNotFoundError:
+        return
+
+
 def list_agent_state_files(env: MuxEnvironment) -> list[Path]:
     """List all agent state files."""
-    agents_dir = get_agents_dir(env)
-    if not agents_dir.exists():
-        return []
-    return list(agents_dir.glob("*.json"))
+    return [Path(entry.path) for entry in _iter_agent_state_entries(env)]
+
+
+def any_agent_state_file(env: MuxEnvironment) -> bool:
+    """Return True as soon as one agent state file is found."""
+    return next(_iter_agent_state_entries(env), None) is not None
 
 
 def read_agent_state(path: Path) -> dict:
-    """Read and parse an agent state file."""
-    return json.loads(path.read_text())
+    """Read and parse an agent state file, mirroring workmux's byte-level parse."""
+    return json.loads(path.read_bytes())
 
 
 def build_status_cmd(env: MuxEnvironment, workmux_exe: Path, status: str) -> str:
@@ -63,75 +79,57 @@ def build_status_cmd(env: MuxEnvironment, workmux_exe: Path, status: str) -> str
     return make_env_script(env, command, {"XDG_STATE_HOME": env.env["XDG_STATE_HOME"]})
 
 
-# -----------------------------------------------------------------------------
-# Tests
-# -----------------------------------------------------------------------------
+def start_working_agent(
+    env: MuxEnvironment, workmux_exe: Path, repo_path: Path, branch_name: str
+) -> str:
+    """Add a worktree with a plain shell pane and mark it as working.
 
-
-def test_set_window_status_creates_state_file(
-    mux_server: MuxEnvironment, workmux_exe_path: Path, mux_repo_path: Path
-):
-    """Verifies that workmux set-window-status creates an agent state file."""
-    env = mux_server
-    branch_name = "feature-state-test"
+    Returns the window name once the agent state file exists.
+    """
     window_name = get_window_name(branch_name)
 
     # Configure with a pane that starts a shell (no blocking command)
     # so we can send keys to it
     write_workmux_config(
-        mux_repo_path,
+        repo_path,
         panes=[
             {"focus": True},  # Just a shell, no command
         ],
     )
 
-    run_workmux_add(env, workmux_exe_path, mux_repo_path, branch_name)
+    run_workmux_add(env, workmux_exe, repo_path, branch_name)
 
-    # Wait for window/shell to be ready
-    wait_for_window_ready(env, window_name)
+    # Wait for the shell to accept input
+    wait_for_shell_ready(env, window_name)
 
     # Send set-window-status command to the pane using tab title
     # This simulates what Claude hooks do when agent starts working
-    status_cmd = build_status_cmd(env, workmux_exe_path, "working")
+    status_cmd = build_status_cmd(env, workmux_exe, "working")
     env.send_keys(window_name, status_cmd)
 
     # Wait for state file to be created
-    def state_file_exists():
-        files = list_agent_state_files(env)
-        return len(files) > 0
-
-    assert poll_until(state_file_exists, timeout=5.0), (
+    assert poll_until(lambda: any_agent_state_file(env), timeout=5.0), (
         f"No agent state file created after set-window-status. "
         f"State dir: {get_agents_dir(env)}"
     )
+    return window_name
 
 
-def test_state_file_has_correct_fields(
-    mux_server: MuxEnvironment, workmux_exe_path: Path, mux_repo_path: Path
-):
-    """Verifies that agent state files contain the expected fields."""
-    env = mux_server
-    branch_name = "feature-fields-test"
-    window_name = get_window_name(branch_name)
-
-    write_workmux_config(
-        mux_repo_path,
-        panes=[
-            {"focus": True},  # Just a shell
-        ],
-    )
-
-    run_workmux_add(env, workmux_exe_path, mux_repo_path, branch_name)
-    wait_for_window_ready(env, window_name)
+# -----------------------------------------------------------------------------
+# Tests
+# -----------------------------------------------------------------------------
 
-    # Trigger state file creation using tab title
-    status_cmd = build_status_cmd(env, workmux_exe_path, "working")
-    env.send_keys(window_name, status_cmd)
 
-    def state_file_exists():
-        return len(list_agent_state_files(env)) > 0
+def test_set_window_status_creates_state_file_with_pane_info(
+    mux_server: MuxEnvironment, workmux_exe_path: Path, mux_repo_path: Path
+):
+    """Verifies that set-window-status creates a state file with the expected fields.
 
-    assert poll_until(state_file_exists, timeout=5.0), "State file not created"
+    Also checks the state file has the information needed for reconciliation
+    to detect stale panes (pane_id, pane_pid, command).
+    """
+    env = mux_server
+    start_working_agent(env, workmux_exe_path, mux_repo_path, "feature-state-test")
 
     # Read and verify state file contents
     state_files = list_agent_state_files(env)
@@ -152,57 +150,16 @@ def test_state_file_has_correct_fields(
 
     # Verify values are sensible
     assert pane_key["backend"] == env.backend_name
-    assert state["pane_pid"] > 0, "pane_pid should be positive"
+    assert pane_key["pane_id"], "pane_id should be set"
     assert state["status"] == "working", (
         f"Expected status 'working', got '{state['status']}'"
     )
-    # Command could be "workmux" (if captured during set-window-status) or the shell
-    assert state["command"], "command should not be empty"
-
-
-def test_state_file_contains_pane_info(
-    mux_server: MuxEnvironment, workmux_exe_path: Path, mux_repo_path: Path
-):
-    """Verifies that state file contains valid pane identification info.
-
-    This tests that the state file has the information needed for reconciliation
-    to detect stale panes (pane_id, pane_pid, command).
-    """
-    env = mux_server
-    branch_name = "feature-pane-info-test"
-    window_name = get_window_name(branch_name)
-
-    write_workmux_config(
-        mux_repo_path,
-        panes=[
-            {"focus": True},  # Just a shell
-        ],
-    )
-
-    run_workmux_add(env, workmux_exe_path, mux_repo_path, branch_name)
-    wait_for_window_ready(env, window_name)
-
-    # Create state file
-    status_cmd = build_status_cmd(env, workmux_exe_path, "working")
-    env.send_keys(window_name, status_cmd)
-
-    def state_file_exists():
-        return len(list_agent_state_files(env)) > 0
-
-    assert poll_until(state_file_exists, timeout=5.0), "State file not created"
-
-    # Read state file and verify reconciliation-relevant fields
-    state_files = list_agent_state_files(env)
-    state = read_agent_state(state_files[0])
-
-    # Verify pane_key has all required fields for pane identification
-    pane_key = state["pane_key"]
-    assert pane_key["pane_id"], "pane_id should be set"
 
     # Verify we have PID and command for stale detection
     assert state["pane_pid"] > 0, (
         "pane_pid should be positive (for PID-based stale detection)"
     )
+    # Command could be "workmux" (if captured during set-window-status) or the shell
     assert state["command"], "command should be set (for command-change detection)"
 
     # Verify workdir is set (useful for context)
@@ -217,28 +174,10 @@ def test_status_update_overwrites_state(
     This ensures the state file is updated (not duplicated) when status changes.
     """
     env = mux_server
-    branch_name = "feature-status-update-test"
-    window_name = get_window_name(branch_name)
-
-    write_workmux_config(
-        mux_repo_path,
-        panes=[
-            {"focus": True},  # Just a shell
-        ],
+    window_name = start_working_agent(
+        env, workmux_exe_path, mux_repo_path, "feature-status-update-test"
     )
 
-    run_workmux_add(env, workmux_exe_path, mux_repo_path, branch_name)
-    wait_for_window_ready(env, window_name)
-
-    # Create initial state with "working" status
-    status_cmd = build_status_cmd(env, workmux_exe_path, "working")
-    env.send_keys(window_name, status_cmd)
-
-    def state_file_exists():
-        return len(list_agent_state_files(env)) > 0
-
-    assert poll_until(state_file_exists, timeout=5.0), "State file not created"
-
     # Verify initial status
     state_files = list_agent_state_files(env)
     assert len(state_files) == 1, f"Expected 1 state file, got {len(state_files)}"
@@ -249,19 +188,17 @@ def test_status_update_overwrites_state(
     status_cmd = build_status_cmd(env, workmux_exe_path, "done")
     env.send_keys(window_name, status_cmd)
 
-    # Poll for status to be updated (more reliable than fixed sleep under load)
+    # workmux replaces the file atomically (temp file + rename), so every read
+    # sees a complete document and no JSONDecodeError retry is needed.
     def status_is_done():
-        files = list_agent_state_files(env)
-        if not files:
-            return False
         try:
-            state = read_agent_state(files[0])
-            return state.get("status") == "done"
-        except json.JSONDecodeError:
-            # File might be partially written, keep polling
+            return read_agent_state(state_files[0])["status"] == "done"
+        except FileNotFoundError:
             return False
 
-    assert poll_until(status_is_done, timeout=5.0), "Status was not updated to 'done'"
+    assert poll_until(status_is_done, timeout=5.0), (
+        f"Expected status 'done', got '{read_agent_state(state_files[0])['status']}'"
+    )
 
     # Should still be exactly 1 state file (updated, not duplicated)
     state_files = list_agent_state_files(env)
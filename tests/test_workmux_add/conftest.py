@@ -1,11 +1,13 @@
 """Fixtures specific to `workmux add` command tests."""
 
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
 
 from ..conftest import (
     MuxEnvironment,
+    ShellCommands,
     get_worktree_path,
     run_workmux_command,
     write_workmux_config,
@@ -71,3 +73,23 @@ def mux_setup_workmux_config(mux_repo_path):
         write_workmux_config(mux_repo_path, **kwargs)
 
     return _setup
+
+
+@pytest.fixture
+def shell_rc(
+    mux_server: MuxEnvironment, shell_cmd: ShellCommands
+) -> Callable[..., Path]:
+    """Use `shell_cmd` as the pane shell; returns a function that appends RC lines.
+
+    The fake-bin PATH prepend is already written by MuxEnvironment, so tests
+    only pass the extra lines they need (aliases, env vars, markers).
+    """
+    mux_server.configure_default_shell(shell_cmd.path)
+    rc_path = mux_server.home_path / shell_cmd.rc_filename
+
+    def _append(*lines: str) -> Path:
+        with rc_path.open("a") as f:
+            f.write("".join(f"{line}\n" for line in lines))
+        return rc_path
+
+    return _append
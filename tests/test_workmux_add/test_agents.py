@@ -1,8 +1,10 @@
 """Tests for agent configuration, prompts, and multi-agent scenarios."""
 
 import shlex
+from collections.abc import Callable
 from pathlib import Path
 
+import pytest
 
 from ..conftest import (
     MuxEnvironment,
@@ -12,13 +14,16 @@ from ..conftest import (
     assert_window_exists,
     get_window_name,
     get_worktree_path,
-    poll_until,
     run_workmux_command,
     wait_for_file,
+    wait_for_glob,
     write_workmux_config,
 )
 from .conftest import add_branch_and_get_worktree
 
+# Bound hung agent/shell startups; individual waits keep their own timeouts.
+pytestmark = pytest.mark.timeout(30)
+
 
 class TestInlinePrompts:
     """Tests for inline prompt injection into agents."""
@@ -226,21 +231,18 @@ printf '%s' "$2" > "{output_filename}"
         agent_output = env.tmp_path / "agent_output.txt"
         default_agent_output = env.tmp_path / "default_agent.txt"
 
-        # Create two fake agents: a default one and the one we'll specify via the flag.
-        # Default agent (claude)
-        fake_agent_installer.install(
-            "claude",
-            f"#!/bin/sh\necho 'default agent ran' > {default_agent_output}",
-        )
-
-        # Override agent (gemini)
-        fake_gemini_path = fake_agent_installer.install(
-            "gemini",
-            f"""#!/bin/sh
-# Gemini gets a -i flag, then the prompt as $2
+        # Create two fake agents: a default one (claude) and the one we'll
+        # specify via the flag (gemini).
+        agent_paths = fake_agent_installer.install_many(
+            {
+                "claude": f"#!/bin/sh\necho 'default agent ran' > {default_agent_output}",
+                # Gemini gets a -i flag, then the prompt as $2
+                "gemini": f"""#!/bin/sh
 printf '%s' "$2" > "{agent_output}"
 """,
+            }
         )
+        fake_gemini_path = agent_paths["gemini"]
 
         # Configure workmux to use <agent> placeholder. The default should be 'claude'.
         write_workmux_config(mux_repo_path, panes=[{"command": "<agent>"}])
@@ -456,14 +458,14 @@ class TestMultiAgent:
         base_name = "feature-multi-agent"
         prompt_text = "Implement for {{ agent }}"
 
-        claude_path = fake_agent_installer.install(
-            "claude",
-            "#!/bin/sh\nprintf '%s' \"$2\" > claude_out.txt",
-        )
-        gemini_path = fake_agent_installer.install(
-            "gemini",
-            "#!/bin/sh\nprintf '%s' \"$2\" > gemini_out.txt",
+        agent_paths = fake_agent_installer.install_many(
+            {
+                "claude": "#!/bin/sh\nprintf '%s' \"$2\" > claude_out.txt",
+                "gemini": "#!/bin/sh\nprintf '%s' \"$2\" > gemini_out.txt",
+            }
         )
+        claude_path = agent_paths["claude"]
+        gemini_path = agent_paths["gemini"]
 
         write_workmux_config(mux_repo_path, panes=[{"command": "<agent>"}])
 
@@ -533,17 +535,8 @@ class TestMultiAgent:
             branch = f"{base_name}-gemini-{idx}"
             worktree = get_worktree_path(mux_repo_path, branch)
             assert worktree.is_dir()
-            files: list[Path] = []
-
-            def _has_output() -> bool:
-                files.clear()
-                files.extend(worktree.glob("gemini_task_*.txt"))
-                return len(files) == 1
-
-            assert poll_until(_has_output, timeout=5.0), (
-                f"gemini output file not found in worktree {worktree}"
-            )
-            assert files[0].read_text() == f"Task {idx}"
+            output = wait_for_glob(worktree, "gemini_task_*.txt")
+            assert output.read_text() == f"Task {idx}"
 
 
 class TestForeach:
@@ -584,12 +577,13 @@ class TestForeach:
             ("ios", "swift"),
             ("android", "kotlin"),
         ]
+        windows = env.list_windows()
         for platform, lang in combos:
             branch = f"{base_name}-{lang}-{platform}"
             worktree = get_worktree_path(mux_repo_path, branch)
             assert worktree.is_dir()
             window = get_window_name(branch)
-            assert_window_exists(env, window)
+            assert_window_exists(env, window, windows)
             wait_for_file(
                 env,
                 worktree / "out.txt",
@@ -665,6 +659,7 @@ class TestShellAliases:
         mux_repo_path: Path,
         fake_agent_installer: FakeAgentInstaller,
         shell_cmd: ShellCommands,
+        shell_rc: Callable[..., Path],
     ):
         """Verifies that the <agent> placeholder triggers aliases defined in shell rc files."""
         env = mux_server
@@ -672,13 +667,8 @@ class TestShellAliases:
         window_name = get_window_name(branch_name)
         marker_content = "alias_was_expanded"
 
-        # Configure the default shell
-        env.configure_default_shell(shell_cmd.path)
-
-        # Append alias definition to RC file (PATH is already set by MuxEnvironment)
-        rc_path = env.home_path / shell_cmd.rc_filename
-        with rc_path.open("a") as f:
-            f.write(shell_cmd.alias("claude", "claude --aliased") + "\n")
+        # Use the shell and define the alias in its RC file
+        shell_rc(shell_cmd.alias("claude", "claude --aliased"))
 
         fake_agent_installer.install(
             "claude",
@@ -717,171 +707,93 @@ exit 1
 
 
 class TestAgentErrors:
-    """Tests for error handling with agent flags."""
-
-    def test_add_fails_with_count_and_multiple_agents(
-        self,
-        mux_server: MuxEnvironment,
-        workmux_exe_path: Path,
-        mux_repo_path: Path,
-    ):
-        """Verifies --count cannot be combined with multiple --agent flags."""
-        env = mux_server
-        result = run_workmux_command(
-            env,
-            workmux_exe_path,
-            mux_repo_path,
-            "add my-feature -n 2 -a claude -a gemini",
-            expect_fail=True,
-        )
-        assert "--count can only be used with zero or one --agent" in result.stderr
-
-    def test_add_fails_with_foreach_and_agent(
-        self,
-        mux_server: MuxEnvironment,
-        workmux_exe_path: Path,
-        mux_repo_path: Path,
-    ):
-        """Verifies clap rejects --foreach in combination with --agent."""
-        env = mux_server
-        result = run_workmux_command(
-            env,
-            workmux_exe_path,
-            mux_repo_path,
-            "add my-feature --foreach 'p:a' -a claude",
-            expect_fail=True,
-        )
-        assert (
-            "'--foreach <FOREACH>' cannot be used with '--agent <AGENT>'"
-            in result.stderr
-        )
-
-    def test_add_fails_with_foreach_mismatched_lengths(
-        self,
-        mux_server: MuxEnvironment,
-        workmux_exe_path: Path,
-        mux_repo_path: Path,
-    ):
-        """Verifies foreach parser enforces equal list lengths."""
-        env = mux_server
-        result = run_workmux_command(
-            env,
-            workmux_exe_path,
-            mux_repo_path,
-            "add my-feature --foreach 'platform:ios,android;lang:swift'",
-            expect_fail=True,
-        )
-        assert (
-            "All --foreach variables must have the same number of values"
-            in result.stderr
-        )
-
-    def test_add_fails_with_prompt_but_no_pane_has_agent_placeholder(
-        self,
-        mux_server: MuxEnvironment,
-        workmux_exe_path: Path,
-        mux_repo_path: Path,
-    ):
-        """Verifies -p fails when panes don't include <agent> placeholder and don't run the default agent."""
-        env = mux_server
-        # Config with no <agent> placeholder - agent defaults to "claude" but no pane runs it
-        write_workmux_config(mux_repo_path, panes=[{"command": "clear"}])
-        result = run_workmux_command(
-            env,
-            workmux_exe_path,
-            mux_repo_path,
-            "add my-feature --prompt 'do something'",
-            expect_fail=True,
-        )
-        # Agent defaults to "claude", so error says no pane runs claude
-        assert "no pane is configured to run the agent" in result.stderr
-        assert "claude" in result.stderr
+    """Tests for error handling with agent flags and template variables."""
 
-    def test_add_fails_with_prompt_but_no_pane_runs_agent(
-        self,
-        mux_server: MuxEnvironment,
-        workmux_exe_path: Path,
-        mux_repo_path: Path,
-    ):
-        """Verifies -p fails when panes don't run the configured agent."""
-        env = mux_server
-        # Config with agent but panes don't use it
-        write_workmux_config(
-            mux_repo_path,
-            agent="claude",
-            panes=[{"command": "vim"}, {"command": "clear", "split": "horizontal"}],
-        )
-        result = run_workmux_command(
-            env,
-            workmux_exe_path,
-            mux_repo_path,
-            "add my-feature --prompt 'do something'",
-            expect_fail=True,
-        )
-        assert "no pane is configured to run the agent" in result.stderr
-        assert "claude" in result.stderr
-
-    def test_add_fails_with_prompt_and_no_pane_cmds(
+    @pytest.mark.parametrize(
+        "config,args,expected_errors",
+        [
+            (
+                None,
+                "add my-feature -n 2 -a claude -a gemini",
+                ["--count can only be used with zero or one --agent"],
+            ),
+            (
+                None,
+                "add my-feature --foreach 'p:a' -a claude",
+                ["'--foreach <FOREACH>' cannot be used with '--agent <AGENT>'"],
+            ),
+            (
+                None,
+                "add my-feature --foreach 'platform:ios,android;lang:swift'",
+                ["All --foreach variables must have the same number of values"],
+            ),
+            # Agent defaults to "claude" but no pane runs it
+            (
+                {"panes": [{"command": "clear"}]},
+                "add my-feature --prompt 'do something'",
+                ["no pane is configured to run the agent", "claude"],
+            ),
+            (
+                {
+                    "agent": "claude",
+                    "panes": [
+                        {"command": "vim"},
+                        {"command": "clear", "split": "horizontal"},
+                    ],
+                },
+                "add my-feature --prompt 'do something'",
+                ["no pane is configured to run the agent", "claude"],
+            ),
+            (
+                {"panes": [{"command": "<agent>"}]},
+                "add my-feature --prompt 'do something' --no-pane-cmds",
+                ["pane commands are disabled"],
+            ),
+            (
+                {"panes": [{"command": "<agent>"}]},
+                "add my-feature --prompt 'Build for {{ undefined_var }}'",
+                ["undefined variables", "undefined_var", "Available variables"],
+            ),
+            (
+                {"panes": []},
+                "add my-feature -n 2 --branch-template '{{ base_name }}-{{ typo }}'",
+                ["Invalid branch name template", "typo"],
+            ),
+        ],
+        ids=[
+            "count-with-multiple-agents",
+            "foreach-with-agent",
+            "foreach-mismatched-lengths",
+            "prompt-no-agent-placeholder",
+            "prompt-no-pane-runs-agent",
+            "prompt-with-no-pane-cmds",
+            "undefined-prompt-variable",
+            "undefined-branch-template-variable",
+        ],
+    )
+    def test_add_rejects_invalid_args(
         self,
         mux_server: MuxEnvironment,
         workmux_exe_path: Path,
         mux_repo_path: Path,
+        config: dict | None,
+        args: str,
+        expected_errors: list[str],
     ):
-        """Verifies -p fails when combined with --no-pane-cmds."""
+        """Verifies invalid flag/config combinations fail with a helpful error."""
         env = mux_server
-        write_workmux_config(mux_repo_path, panes=[{"command": "<agent>"}])
+        if config is not None:
+            write_workmux_config(mux_repo_path, **config)
         result = run_workmux_command(
-            env,
-            workmux_exe_path,
-            mux_repo_path,
-            "add my-feature --prompt 'do something' --no-pane-cmds",
-            expect_fail=True,
+            env, workmux_exe_path, mux_repo_path, args, expect_fail=True
         )
-        assert "pane commands are disabled" in result.stderr
+        for expected in expected_errors:
+            assert expected in result.stderr
 
 
 class TestTemplateVariableValidation:
     """Tests for template variable validation."""
 
-    def test_add_fails_with_undefined_prompt_variable(
-        self,
-        mux_server: MuxEnvironment,
-        workmux_exe_path: Path,
-        mux_repo_path: Path,
-    ):
-        """Verifies prompt with undefined template variable fails with helpful error."""
-        env = mux_server
-        write_workmux_config(mux_repo_path, panes=[{"command": "<agent>"}])
-        result = run_workmux_command(
-            env,
-            workmux_exe_path,
-            mux_repo_path,
-            "add my-feature --prompt 'Build for {{ undefined_var }}'",
-            expect_fail=True,
-        )
-        assert "undefined variables" in result.stderr
-        assert "undefined_var" in result.stderr
-        assert "Available variables" in result.stderr
-
-    def test_add_fails_with_undefined_branch_template_variable(
-        self,
-        mux_server: MuxEnvironment,
-        workmux_exe_path: Path,
-        mux_repo_path: Path,
-    ):
-        """Verifies branch template with undefined variable fails with helpful error."""
-        env = mux_server
-        write_workmux_config(mux_repo_path, panes=[])
-        result = run_workmux_command(
-            env,
-            workmux_exe_path,
-            mux_repo_path,
-            "add my-feature -n 2 --branch-template '{{ base_name }}-{{ typo }}'",
-            expect_fail=True,
-        )
-        assert "Invalid branch name template" in result.stderr
-        assert "typo" in result.stderr
-
     def test_add_succeeds_with_valid_foreach_variables(
         self,
         mux_server: MuxEnvironment,
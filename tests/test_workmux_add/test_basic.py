@@ -135,11 +135,12 @@ class TestCountFlag:
             f"add {base_name} -n 2",
         )
 
+        windows = env.list_windows()
         for idx in (1, 2):
             branch = f"{base_name}-{idx}"
             worktree = get_worktree_path(mux_repo_path, branch)
             assert worktree.is_dir()
-            assert_window_exists(env, get_window_name(branch))
+            assert_window_exists(env, get_window_name(branch), windows)
 
 
 class TestBaseFlag:
@@ -154,12 +155,9 @@ class TestBaseFlag:
 
         write_workmux_config(mux_repo_path)
 
-        # Create a commit on the current branch
+        # Create a commit on the current branch (the template repo starts on main)
         create_commit(env, mux_repo_path, "Add base file")
-
-        # Get current branch name
-        result = env.run_command(["git", "branch", "--show-current"], cwd=mux_repo_path)
-        base_branch = result.stdout.strip()
+        base_branch = "main"
 
         # Run workmux add with --base flag
         worktree_path = add_branch_and_get_worktree(
@@ -307,11 +305,8 @@ class TestExistingBranch:
 
         write_workmux_config(mux_repo_path)
 
-        # Remember the default branch so we can switch back after preparing the feature branch
-        current_branch_result = env.run_command(
-            ["git", "branch", "--show-current"], cwd=mux_repo_path
-        )
-        default_branch = current_branch_result.stdout.strip()
+        # The template repo starts on main; switch back to it after preparing the feature branch
+        default_branch = "main"
 
         # Create and populate an existing branch
         env.run_command(["git", "checkout", "-b", branch_name], cwd=mux_repo_path)
@@ -346,13 +341,10 @@ class TestExistingBranch:
 
         write_workmux_config(mux_repo_path)
 
-        # Create the branch and then return to the default branch
-        env.run_command(["git", "checkout", "-b", branch_name], cwd=mux_repo_path)
-        env.run_command(["git", "checkout", "main"], cwd=mux_repo_path)
-
-        # Manually create a git worktree for the branch to simulate the pre-existing state
+        # Manually create the branch and a git worktree for it to simulate the
+        # pre-existing state, leaving the main checkout on the default branch
         env.run_command(
-            ["git", "worktree", "add", str(existing_worktree_path), branch_name],
+            ["git", "worktree", "add", "-b", branch_name, str(existing_worktree_path)],
             cwd=mux_repo_path,
         )
 
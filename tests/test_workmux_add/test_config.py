@@ -157,6 +157,8 @@ class TestGlobalPlaceholderFiles:
         env = mux_server
         branch_name = "feature-partial-file-merge"
 
+        # Ignored, untracked files: nothing is committed, so copies and
+        # symlinks are the only way they can reach the worktree.
         repo_builder.add_to_gitignore(
             [
                 "global_copy.txt",
@@ -1,8 +1,8 @@
 """Tests for post_create hooks and pane commands in `workmux add`."""
 
+from collections.abc import Callable
 from pathlib import Path
 
-
 from ..conftest import (
     MuxEnvironment,
     ShellCommands,
@@ -116,6 +116,7 @@ class TestShellRcFiles:
         workmux_exe_path: Path,
         mux_repo_path: Path,
         shell_cmd: ShellCommands,
+        shell_rc: Callable[..., Path],
     ):
         """Verifies that pane commands run in a shell that has sourced its rc file."""
         env = mux_server
@@ -123,13 +124,8 @@ class TestShellRcFiles:
         window_name = get_window_name(branch_name)
         alias_output = "custom_alias_worked_correctly"
 
-        # Configure the default shell
-        env.configure_default_shell(shell_cmd.path)
-
-        # Append alias to RC file (base PATH already set by MuxEnvironment)
-        rc_path = env.home_path / shell_cmd.rc_filename
-        with rc_path.open("a") as f:
-            f.write(shell_cmd.alias("testcmd", f'echo "{alias_output}"') + "\n")
+        # Use the shell and define the alias in its RC file
+        shell_rc(shell_cmd.alias("testcmd", f'echo "{alias_output}"'))
 
         write_workmux_config(mux_repo_path, panes=[{"command": "testcmd"}])
 
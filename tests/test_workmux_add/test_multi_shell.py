@@ -5,6 +5,7 @@ These tests verify that workmux works correctly with different shells.
 Run with TEST_ALL_SHELLS=1 to test all available shells.
 """
 
+from collections.abc import Callable
 from pathlib import Path
 
 from ..conftest import (
@@ -51,18 +52,15 @@ class TestShellCompatibility:
         workmux_exe_path: Path,
         mux_repo_path: Path,
         shell_cmd: ShellCommands,
+        shell_rc: Callable[..., Path],
     ):
         """Verifies environment variables from RC files work in pane commands."""
         env = mux_server
         branch_name = "test-env-var"
         window_name = get_window_name(branch_name)
 
-        env.configure_default_shell(shell_cmd.path)
-
-        # Append env var to RC file (base PATH already set by MuxEnvironment)
-        rc_path = env.home_path / shell_cmd.rc_filename
-        with rc_path.open("a") as f:
-            f.write(shell_cmd.set_env("TEST_MARKER", "env_var_works") + "\n")
+        # Use the shell and export the env var from its RC file
+        shell_rc(shell_cmd.set_env("TEST_MARKER", "env_var_works"))
 
         # Use shell-specific env var reference syntax
         write_workmux_config(
@@ -625,9 +625,8 @@ class TestRescueErrors:
 
         write_workmux_config(mux_repo_path)
 
-        # Create the branch
-        env.run_command(["git", "checkout", "-b", branch_name], cwd=mux_repo_path)
-        env.run_command(["git", "checkout", "main"], cwd=mux_repo_path)
+        # Create the branch without leaving main
+        env.run_command(["git", "branch", branch_name], cwd=mux_repo_path)
 
         # Create uncommitted changes
         test_file = mux_repo_path / "test.txt"
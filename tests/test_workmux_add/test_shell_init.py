@@ -1,5 +1,8 @@
 """Tests for shell initialization and login shell behavior."""
 
+from collections.abc import Callable
+from pathlib import Path
+
 import pytest
 
 from ..conftest import (
@@ -23,7 +26,7 @@ class TestLoginShell:
         mux_server: MuxEnvironment,
         workmux_exe_path,
         repo_path,
-        shell_cmd: ShellCommands,
+        shell_rc: Callable[..., Path],
     ):
         """
         Verifies that panes are started as login shells by checking if
@@ -33,14 +36,9 @@ class TestLoginShell:
         branch_name = "feature-login-shell"
         marker_file = env.home_path / "profile_loaded"
 
-        # 1. Configure the shell
-        env.configure_default_shell(shell_cmd.path)
-
-        # 2. Append marker creation to RC file
+        # 1-2. Configure the shell and append marker creation to its RC file
         # This is only executed if the shell starts properly
-        rc_path = env.home_path / shell_cmd.rc_filename
-        with rc_path.open("a") as f:
-            f.write(f"touch {marker_file}\n")
+        shell_rc(f"touch {marker_file}")
 
         # 3. Create workmux config with a command
         # A command is required to trigger the wrapper logic in setup_panes
@@ -59,6 +57,7 @@ class TestLoginShell:
         workmux_exe_path,
         repo_path,
         shell_cmd: ShellCommands,
+        shell_rc: Callable[..., Path],
     ):
         """
         Verifies that split panes are also started as login shells.
@@ -67,13 +66,8 @@ class TestLoginShell:
         branch_name = "feature-split-login"
         log_file = env.home_path / "profile_log"
 
-        # 1. Configure the shell
-        env.configure_default_shell(shell_cmd.path)
-
-        # 2. Append log-writing to RC file
-        rc_path = env.home_path / shell_cmd.rc_filename
-        with rc_path.open("a") as f:
-            f.write(shell_cmd.append_to_file("loaded", str(log_file)) + "\n")
+        # 1-2. Configure the shell and append log-writing to its RC file
+        shell_rc(shell_cmd.append_to_file("loaded", str(log_file)))
 
         # 3. Create workmux config with two panes (one initial, one split)
         write_workmux_config(
@@ -42,6 +42,7 @@ class TestStdinInput:
         )
 
         # Verify all expected worktrees and windows exist
+        windows = env.list_windows()
         for item in ["feature-a", "feature-b"]:
             expected_handle = slugify(f"topic-{item}")
             worktree_path = (
@@ -52,7 +53,7 @@ class TestStdinInput:
             assert worktree_path.is_dir(), f"Expected worktree at {worktree_path}"
 
             expected_window = f"{DEFAULT_WINDOW_PREFIX}{expected_handle}"
-            assert_window_exists(env, expected_window)
+            assert_window_exists(env, expected_window, windows)
 
     def test_stdin_with_custom_branch_template(
         self,
@@ -75,6 +76,7 @@ class TestStdinInput:
         )
 
         # Verify worktrees were created with custom template
+        windows = env.list_windows()
         for item in ["api", "auth"]:
             expected_handle = slugify(f"{item}-feature")
             worktree_path = (
@@ -83,7 +85,9 @@ class TestStdinInput:
                 / expected_handle
             )
             assert worktree_path.is_dir(), f"Expected worktree at {worktree_path}"
-            assert_window_exists(env, f"{DEFAULT_WINDOW_PREFIX}{expected_handle}")
+            assert_window_exists(
+                env, f"{DEFAULT_WINDOW_PREFIX}{expected_handle}", windows
+            )
 
     def test_stdin_conflicts_with_foreach_flag(
         self,
@@ -214,13 +218,13 @@ Task for {{ input }}
         )
 
         # Should only create two worktrees (empty lines filtered)
-        assert_window_exists(env, f"{DEFAULT_WINDOW_PREFIX}task-first")
-        assert_window_exists(env, f"{DEFAULT_WINDOW_PREFIX}task-second")
+        windows = env.list_windows()
+        assert_window_exists(env, f"{DEFAULT_WINDOW_PREFIX}task-first", windows)
+        assert_window_exists(env, f"{DEFAULT_WINDOW_PREFIX}task-second", windows)
 
         # Verify no window for empty input
-        window_list = env.list_windows()
         # Ensure we only have the expected windows plus the test session window
-        window_names = [w for w in window_list if w.startswith(DEFAULT_WINDOW_PREFIX)]
+        window_names = [w for w in windows if w.startswith(DEFAULT_WINDOW_PREFIX)]
         assert len(window_names) == 2
 
     def test_stdin_with_whitespace_trimmed(
@@ -269,6 +273,7 @@ Task for {{ input }}
         )
 
         # Verify worktrees created with names from JSON 'name' key
+        windows = env.list_windows()
         for name in ["workmux", "tmux-tools"]:
             expected_handle = slugify(f"analyze-{name}")
             worktree_path = (
@@ -277,7 +282,9 @@ Task for {{ input }}
                 / expected_handle
             )
             assert worktree_path.is_dir(), f"Expected worktree at {worktree_path}"
-            assert_window_exists(env, f"{DEFAULT_WINDOW_PREFIX}{expected_handle}")
+            assert_window_exists(
+                env, f"{DEFAULT_WINDOW_PREFIX}{expected_handle}", windows
+            )
 
     def test_stdin_json_lines_preserve_input_variable(
         self,
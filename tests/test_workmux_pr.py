@@ -10,7 +10,6 @@ from .conftest import (
     get_worktree_path,
     install_fake_gh_cli,
     run_workmux_command,
-    setup_git_repo,
 )
 
 
@@ -52,11 +51,11 @@ def setup_pr_remote_and_branch(
     env.run_command(["git", "branch", "-D", branch_name], cwd=repo_path)
 
 
-def test_add_pr_from_same_repo(mux_server, workmux_exe_path, remote_repo_path):
+def test_add_pr_from_same_repo(
+    mux_server, workmux_exe_path, repo_path, remote_repo_path
+):
     """Test basic PR checkout from same repository"""
     env = mux_server
-    repo_path = env.tmp_path
-    setup_git_repo(repo_path, env.env)
 
     setup_pr_remote_and_branch(env, repo_path, remote_repo_path, "feature-branch")
 
@@ -84,11 +83,11 @@ def test_add_pr_from_same_repo(mux_server, workmux_exe_path, remote_repo_path):
     assert window_name in windows
 
 
-def test_add_pr_with_custom_branch_name(mux_server, workmux_exe_path, remote_repo_path):
+def test_add_pr_with_custom_branch_name(
+    mux_server, workmux_exe_path, repo_path, remote_repo_path
+):
     """Test PR checkout with custom branch name"""
     env = mux_server
-    repo_path = env.tmp_path
-    setup_git_repo(repo_path, env.env)
 
     setup_pr_remote_and_branch(env, repo_path, remote_repo_path, "feature-branch")
 
@@ -116,11 +115,11 @@ def test_add_pr_with_custom_branch_name(mux_server, workmux_exe_path, remote_rep
     assert window_name in windows
 
 
-def test_add_pr_merged_state_warning(mux_server, workmux_exe_path, remote_repo_path):
+def test_add_pr_merged_state_warning(
+    mux_server, workmux_exe_path, repo_path, remote_repo_path
+):
     """Test warning is displayed for merged PRs"""
     env = mux_server
-    repo_path = env.tmp_path
-    setup_git_repo(repo_path, env.env)
 
     setup_pr_remote_and_branch(env, repo_path, remote_repo_path, "merged-branch")
 
@@ -143,11 +142,11 @@ def test_add_pr_merged_state_warning(mux_server, workmux_exe_path, remote_repo_p
     assert worktree_path.exists()
 
 
-def test_add_pr_draft_warning(mux_server, workmux_exe_path, remote_repo_path):
+def test_add_pr_draft_warning(
+    mux_server, workmux_exe_path, repo_path, remote_repo_path
+):
     """Test warning is displayed for draft PRs"""
     env = mux_server
-    repo_path = env.tmp_path
-    setup_git_repo(repo_path, env.env)
 
     setup_pr_remote_and_branch(env, repo_path, remote_repo_path, "draft-branch")
 
@@ -170,12 +169,10 @@ def test_add_pr_draft_warning(mux_server, workmux_exe_path, remote_repo_path):
 
 
 def test_add_pr_fails_on_invalid_pr_number(
-    mux_server, workmux_exe_path, remote_repo_path
+    mux_server, workmux_exe_path, repo_path, remote_repo_path
 ):
     """Test error handling for invalid PR number"""
     env = mux_server
-    repo_path = env.tmp_path
-    setup_git_repo(repo_path, env.env)
 
     env.run_command(
         ["git", "remote", "add", "origin", str(remote_repo_path)],
@@ -201,12 +198,10 @@ def test_add_pr_fails_on_invalid_pr_number(
 
 
 def test_add_pr_fails_when_gh_not_installed(
-    mux_server, workmux_exe_path, remote_repo_path
+    mux_server, workmux_exe_path, repo_path, remote_repo_path
 ):
     """Test error when gh CLI is not available"""
     env = mux_server
-    repo_path = env.tmp_path
-    setup_git_repo(repo_path, env.env)
 
     env.run_command(
         ["git", "remote", "add", "origin", str(remote_repo_path)],
@@ -224,12 +219,10 @@ def test_add_pr_fails_when_gh_not_installed(
 
 
 def test_add_pr_conflicts_with_base_flag(
-    mux_server, workmux_exe_path, remote_repo_path
+    mux_server, workmux_exe_path, repo_path, remote_repo_path
 ):
     """Test that --pr conflicts with --base flag"""
     env = mux_server
-    repo_path = env.tmp_path
-    setup_git_repo(repo_path, env.env)
 
     result = run_workmux_command(
         env,
@@ -245,11 +238,11 @@ def test_add_pr_conflicts_with_base_flag(
     )
 
 
-def test_add_pr_fork_with_main_branch(mux_server, workmux_exe_path, remote_repo_path):
+def test_add_pr_fork_with_main_branch(
+    mux_server, workmux_exe_path, repo_path, remote_repo_path
+):
     """Test that fork PRs with branch 'main' get prefixed with owner to avoid conflict"""
     env = mux_server
-    repo_path = env.tmp_path
-    setup_git_repo(repo_path, env.env)
 
     # Set up origin with a GitHub-style URL
     github_url = "https://github.com/testowner/testrepo.git"
@@ -322,12 +315,10 @@ def test_add_pr_fork_with_main_branch(mux_server, workmux_exe_path, remote_repo_
 
 
 def test_add_pr_fails_when_worktree_exists(
-    mux_server, workmux_exe_path, remote_repo_path
+    mux_server, workmux_exe_path, repo_path, remote_repo_path
 ):
     """Test error when trying to checkout same PR twice"""
     env = mux_server
-    repo_path = env.tmp_path
-    setup_git_repo(repo_path, env.env)
 
     setup_pr_remote_and_branch(env, repo_path, remote_repo_path, "feature-branch")
 